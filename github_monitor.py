@@ -6,18 +6,26 @@ GitHub Actions용 국립공원 예약 모니터링 - 당월/익월 자동 체크
 
 import os
 import sys
-import json
-import time
 import logging
+import time
 import requests
 import re
 import subprocess
-from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
+import asyncio
+import calendar
+import functools
+import hashlib
+import itertools
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from types import MappingProxyType
+import orjson
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+# selenium은 HTTP 조회가 실패해 브라우저로 폴백할 때만 필요하므로 사용하는 메서드 안에서 import
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,30 +33,83 @@ logging.basicConfig(
     handlers=[logging.StreamHandler(sys.stdout)]
 )
 
+# 파싱용 정규식 (셀/요소마다 반복 사용되므로 미리 컴파일)
+_REMAIN_RE = re.compile(r'생활관\s*:\s*잔여\s*(\d+)\s*개')
+_NON_DIGIT_RE = re.compile(r'\D')
+
+WEEKDAY_NAMES = ('월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일')
+
+
+@functools.lru_cache(maxsize=32)
+def weekend_days_in_month(year, month, weekend_days):
+    """해당 월의 주말 날짜 → (날짜 문자열, 요일명) (셀마다 datetime/포맷을 만들지 않도록 월 단위로 캐시)"""
+    first_weekday, days_in_month = calendar.monthrange(year, month)
+    return MappingProxyType({
+        day: (date(year, month, day).isoformat(), WEEKDAY_NAMES[(first_weekday + day - 1) % 7])
+        for day in range(1, days_in_month + 1)
+        if (first_weekday + day - 1) % 7 in weekend_days
+    })
+
 class GitHubActionsMonitor:
+    # 인스턴스 속성은 실행 시점에 정해지는 값만 (상수는 아래 클래스 속성)
+    __slots__ = (
+        'checked_at', 'target_year', 'target_months', 'next_year', 'month_targets',
+        'max_workers', 'http_workers', '_drivers', '_driver_uses', '_idle_slots', '_drivers_lock',
+        'telegram_config', 'telegram_url', 'response_cache', 'next_response_cache', 'session',
+    )
+    
+    SITE_ROOT = "https://reservation.knps.or.kr/"
+    # 메시지 한 건 최대 길이 (UTF-16 코드 유닛 기준)
+    TELEGRAM_MAX_LENGTH = 4096
+    TELEGRAM_API_ROOT = "https://api.telegram.org/"
+    url = SITE_ROOT + "eco/searchEcoMonthReservation.do"
+    
+    weekend_days = frozenset({4, 5})  # 금요일, 토요일
+    
+    # 모니터링할 공원 설정
+    parks = MappingProxyType({
+        '북한산': 'B971002', '변산반도': 'B183001', '한려해상': 'B024002'
+    })
+    
+    # 비활성화된 공원들 (필요시 위에 추가)
+    # '지리산': 'B014003', '무등산': 'B061002', '내장산': 'B063002', '설악산': 'B301002', '소백산': 'B123002', '가야산': 'B051001'
+    
+    state_file = 'knps_state.json'
+    GIT_IDENTITY = {
+        'GIT_AUTHOR_NAME': 'KNPS Monitor', 'GIT_AUTHOR_EMAIL': 'knps-monitor@github-actions',
+        'GIT_COMMITTER_NAME': 'KNPS Monitor', 'GIT_COMMITTER_EMAIL': 'knps-monitor@github-actions',
+    }
+    # (공원, 월)별 응답 해시와 파싱 결과 - 응답이 그대로면 재파싱하지 않음
+    cache_file = 'knps_cache.json'
+    # 파싱 결과가 달라지게 parse_calendar_html을 고치면 올림 (캐시 키에 포함되어 이전 버전 결과는 재사용하지 않음)
+    PARSER_VERSION = 2
+    
+    # 달력 셀 - data 속성을 가진 요소들만
+    CALENDAR_CELL_CSS = ".calendar-cell[data-deptid][data-usedt]"
+    # 드라이버 하나로 체크할 최대 횟수 (오래 띄운 Chrome의 메모리 증가 방지, 반복 모드에서 의미 있음)
+    DRIVER_MAX_USES = 50
+    # 브라우저에서 받지 않을 리소스 (웹폰트, 방문 통계·광고 스크립트)
+    BLOCKED_URL_PATTERNS = [
+        '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*wcs.naver.net*', '*analytics.naver.com*',
+    ]
+    
+    CALENDAR_CELL_XPATH = "//*[contains(concat(' ', normalize-space(@class), ' '), ' calendar-cell ')][@data-deptid][@data-usedt]"
+
     def __init__(self):
-        self.url = "https://reservation.knps.or.kr/eco/searchEcoMonthReservation.do"
-        
-        # 현재 날짜 기준으로 당월과 익월 설정
-        now = datetime.now()
-        self.target_year = now.year
-        self.target_months = [now.month, (now.month % 12) + 1]
-        
-        # 익월이 1월인 경우 연도 조정
-        if self.target_months[1] == 1:
-            self.next_year = self.target_year + 1
-        else:
-            self.next_year = self.target_year
-        
-        self.weekend_days = [4, 5]  # 금요일, 토요일
+        self.set_check_time()
         
-        # 모니터링할 공원 설정
-        self.parks = {
-            '북한산': 'B971002', '변산반도': 'B183001', '한려해상': 'B024002'
-        }
+        # 동시 체크 워커 수 (공원마다 Chrome 1개, 2코어 러너 기준 4개 이하)
+        self.max_workers = min(4, len(self.parks))
+        # HTTP 요청은 공원 × 월 단위로 동시 실행
+        self.http_workers = min(8, len(self.parks) * len(self.target_months))
         
-        # 비활성화된 공원들 (필요시 위에 추가)
-        # '지리산': 'B014003', '무등산': 'B061002', '내장산': 'B063002', '설악산': 'B301002', '소백산': 'B123002', '가야산': 'B051001'
+        # 드라이버 풀 - 체크가 끝난 드라이버는 반납해 다음 공원(반복 모드면 다음 회차)에서 재사용
+        self._drivers = {}  # 슬롯 번호 → 드라이버
+        self._driver_uses = {}  # 슬롯 번호 → 사용 횟수
+        self._idle_slots = []
+        self._drivers_lock = threading.Lock()
         
         self.telegram_config = {
             'bot_token': os.environ.get('TELEGRAM_BOT_TOKEN'),
@@ -59,16 +120,51 @@ class GitHubActionsMonitor:
             logging.error("텔레그램 설정이 없습니다. GitHub Secrets를 확인하세요.")
             sys.exit(1)
         
-        self.state_file = 'knps_state.json'
+        self.telegram_url = f"{self.TELEGRAM_API_ROOT}bot{self.telegram_config['bot_token']}/sendMessage"
+        
+        self.response_cache = {}
+        self.next_response_cache = {}
+        
+        # 예약 사이트·텔레그램 공용 세션 (호스트별 어댑터로 커넥션 유지)
+        self.session = requests.Session()
+        # 예약 사이트 달력 조회는 조회용 POST라 일시 오류 시 재시도해도 안전
+        self.session.mount(self.SITE_ROOT, HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.http_workers,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504],
+                              allowed_methods=['GET', 'POST'])
+        ))
+        # 텔레그램은 처리되지 않은 게 확실한 경우(연결 실패, 429, 503)만 재시도 - 중복 발송 방지
+        # (응답 읽기 실패·502·504는 이미 발송됐을 수 있어 재시도하지 않음)
+        self.session.mount(self.TELEGRAM_API_ROOT, HTTPAdapter(
+            pool_connections=1, pool_maxsize=2,
+            max_retries=Retry(total=3, read=0, backoff_factor=0.5, status_forcelist=[429, 503],
+                              allowed_methods=['POST'])
+        ))
         
         logging.info(f"모니터링 대상: {self.target_year}년 {self.target_months[0]}월, {self.next_year}년 {self.target_months[1]}월")
 
+    def set_check_time(self):
+        """체크 시각과 대상 월 설정 (현재 날짜 기준 당월과 익월)"""
+        now = datetime.now()
+        # 커밋 메시지·알림에 쓰는 체크 시각 (한 번만 포맷)
+        self.checked_at = now.strftime('%Y-%m-%d %H:%M:%S')
+        self.target_year = now.year
+        self.target_months = [now.month, (now.month % 12) + 1]
+        
+        # 익월이 1월인 경우 연도 조정
+        if self.target_months[1] == 1:
+            self.next_year = self.target_year + 1
+        else:
+            self.next_year = self.target_year
+        
+        self.month_targets = [(self.target_months[0], self.target_year), (self.target_months[1], self.next_year)]
+
     def load_previous_state(self):
         """이전 상태 로드"""
         try:
             if os.path.exists(self.state_file):
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state = orjson.loads(f.read())
                 logging.info(f"이전 상태 로드됨: {len(state)} 항목")
                 return state
             else:
@@ -78,87 +174,112 @@ class GitHubActionsMonitor:
             logging.error(f"상태 파일 로드 실패: {e}")
             return {}
 
+    def load_response_cache(self):
+        """이전 응답 해시 캐시 로드"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'rb') as f:
+                    return orjson.loads(f.read())
+        except Exception as e:
+            logging.warning(f"응답 캐시 로드 실패: {e}")
+        return {}
+
+    def read_file(self, path):
+        """파일 내용 바이트 (없으면 None)"""
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
     def save_current_state(self, current_results):
         """현재 상태를 Git에 저장"""
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(current_results, f, ensure_ascii=False, indent=2)
+            contents = {
+                self.state_file: orjson.dumps(current_results, option=orjson.OPT_INDENT_2),
+                # 이번 실행에서 받은 (공원, 월) 응답만 남겨 캐시 갱신
+                self.cache_file: orjson.dumps(self.next_response_cache, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS),
+            }
             
-            subprocess.run(['git', 'config', 'user.name', 'KNPS Monitor'], check=True)
-            subprocess.run(['git', 'config', 'user.email', 'knps-monitor@github-actions'], check=True)
+            changed_files = [path for path, content in contents.items() if self.read_file(path) != content]
             
-            subprocess.run(['git', 'add', self.state_file], check=True)
+            for path in changed_files:
+                with open(path, 'wb') as f:
+                    f.write(contents[path])
+            
+            # 상태 파일이 그대로면 git 작업 전체 생략
+            # (캐시만 바뀐 경우는 커밋하지 않음 - 다음 실행에서 해시가 다르면 다시 파싱할 뿐)
+            if self.state_file not in changed_files:
+                logging.info("상태 변화 없어 커밋하지 않음")
+                return
+            
+            # 커밋 작성자는 git config 대신 환경 변수로 지정
+            git_env = {**os.environ, **self.GIT_IDENTITY}
+            
+            subprocess.run(['git', 'add', *contents], check=True)
             
             try:
-                subprocess.run(['git', 'commit', '-m', f'Update monitoring state - {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}'], 
-                              check=True, capture_output=True, text=True)
+                subprocess.run(['git', 'commit', '-m', f'Update monitoring state - {self.checked_at}'],
+                              check=True, env=git_env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 logging.info("상태 파일 커밋 완료")
             except subprocess.CalledProcessError as e:
-                if "nothing to commit" in str(e.stdout):
-                    logging.info("상태 변화 없어 커밋하지 않음")
-                else:
-                    logging.error(f"커밋 실패: {e}")
+                logging.error(f"커밋 실패: {e.stderr.strip()}")
+                return
             
             try:
-                subprocess.run(['git', 'push'], check=True, capture_output=True)
+                subprocess.run(['git', 'push'], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
                 logging.info("상태 파일 푸시 완료")
             except subprocess.CalledProcessError as e:
-                logging.error(f"푸시 실패: {e}")
+                logging.error(f"푸시 실패: {e.stderr.strip()}")
                 
         except Exception as e:
             logging.error(f"상태 저장 실패: {e}")
 
+    def flatten_results(self, results):
+        """{공원: {월: [날짜...]}} → {(공원, 날짜): (월, 날짜 정보)} (레코드 dict는 새로 만들지 않음)"""
+        return {
+            (park_name, date_info['date']): (month_name, date_info)
+            for park_name, months_data in results.items()
+            for month_name, dates in months_data.items()
+            for date_info in dates
+        }
+
+    def change_record(self, key, month_name, date_info):
+        """변경 목록에 넣을 레코드 (바뀐 날짜만 만들어짐)"""
+        return {
+            'park': key[0], 'month': month_name,
+            'date': date_info['date'], 'weekday': date_info['weekday'],
+            'remaining': date_info['remaining']
+        }
+
     def compare_states(self, previous_state, current_results):
         """상태 비교"""
-        changes = {'new': {}, 'removed': {}, 'updated': {}}
+        changes = {'new': defaultdict(list), 'removed': defaultdict(list), 'updated': defaultdict(list)}
         
         try:
-            current_flat = {}
-            for park_name, months_data in current_results.items():
-                for month_name, dates in months_data.items():
-                    for date_info in dates:
-                        key = f"{park_name}-{date_info['date']}"
-                        current_flat[key] = {
-                            'park': park_name, 'month': month_name,
-                            'date': date_info['date'], 'weekday': date_info['weekday'],
-                            'remaining': date_info['remaining']
-                        }
-            
-            previous_flat = {}
-            for park_name, months_data in previous_state.items():
-                for month_name, dates in months_data.items():
-                    for date_info in dates:
-                        key = f"{park_name}-{date_info['date']}"
-                        previous_flat[key] = {
-                            'park': park_name, 'month': month_name,
-                            'date': date_info['date'], 'weekday': date_info['weekday'],
-                            'remaining': date_info['remaining']
-                        }
+            current_flat = self.flatten_results(current_results)
+            previous_flat = self.flatten_results(previous_state)
+            
+            current_keys = current_flat.keys()
+            previous_keys = previous_flat.keys()
             
             # 새로 생긴 예약
-            for key, data in current_flat.items():
-                if key not in previous_flat:
-                    park = data['park']
-                    if park not in changes['new']:
-                        changes['new'][park] = []
-                    changes['new'][park].append(data)
-                elif previous_flat[key]['remaining'] != data['remaining']:
-                    park = data['park']
-                    if park not in changes['updated']:
-                        changes['updated'][park] = []
-                    changes['updated'][park].append({
-                        **data,
-                        'prev_remaining': previous_flat[key]['remaining'],
-                        'curr_remaining': data['remaining']
+            for key in current_keys - previous_keys:
+                changes['new'][key[0]].append(self.change_record(key, *current_flat[key]))
+            
+            # 잔여 개수가 바뀐 예약
+            for key in current_keys & previous_keys:
+                month_name, date_info = current_flat[key]
+                prev_remaining = previous_flat[key][1]['remaining']
+                if prev_remaining != date_info['remaining']:
+                    changes['updated'][key[0]].append({
+                        **self.change_record(key, month_name, date_info),
+                        'prev_remaining': prev_remaining,
+                        'curr_remaining': date_info['remaining']
                     })
             
             # 사라진 예약
-            for key, data in previous_flat.items():
-                if key not in current_flat:
-                    park = data['park']
-                    if park not in changes['removed']:
-                        changes['removed'][park] = []
-                    changes['removed'][park].append(data)
+            for key in previous_keys - current_keys:
+                changes['removed'][key[0]].append(self.change_record(key, *previous_flat[key]))
             
             return changes
             
@@ -166,252 +287,590 @@ class GitHubActionsMonitor:
             logging.error(f"상태 비교 실패: {e}")
             return changes
 
-    def setup_driver(self):
+    def setup_driver(self, slot=0):
         """Chrome 드라이버 설정"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        
         chrome_options = Options()
-        chrome_options.add_argument('--headless')
+        chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
+        chrome_options.add_argument('--window-size=1280,900')
+        
+        # 스크래핑에 필요 없는 브라우저 부가 기능 끄기
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.add_argument('--disable-extensions')
+        chrome_options.add_argument('--disable-background-networking')
+        chrome_options.add_argument('--disable-default-apps')
+        chrome_options.add_argument('--disable-sync')
+        chrome_options.add_argument('--disable-translate')
+        chrome_options.add_argument('--disable-features=TranslateUI')
+        chrome_options.add_argument('--disable-client-side-phishing-detection')
+        chrome_options.add_argument('--disable-renderer-backgrounding')
+        chrome_options.add_argument('--mute-audio')
+        
+        # 사이트 정적 리소스를 실행 간에도 재사용하도록 디스크 캐시 유지 (워크플로에서 actions/cache로 보존)
+        cache_root = os.environ.get('KNPS_CACHE_DIR', '/tmp/knps-cache')
+        profile_dir = os.path.join(cache_root, f'profile-{slot}')
+        disk_cache_dir = os.path.join(cache_root, f'disk-{slot}')
+        os.makedirs(profile_dir, exist_ok=True)
+        os.makedirs(disk_cache_dir, exist_ok=True)
+        # 캐시에서 복원된 프로필의 이전 실행 잠금 파일 제거 (다른 호스트 잠금이면 Chrome이 시작 거부)
+        for lock_name in ('SingletonLock', 'SingletonSocket', 'SingletonCookie'):
+            lock_path = os.path.join(profile_dir, lock_name)
+            if os.path.lexists(lock_path):
+                os.remove(lock_path)
+        chrome_options.add_argument(f'--user-data-dir={profile_dir}')
+        chrome_options.add_argument(f'--disk-cache-dir={disk_cache_dir}')
+        
+        # DOMContentLoaded에서 driver.get 반환 (필요한 요소는 명시적으로 대기)
+        chrome_options.page_load_strategy = 'eager'
+        
+        # 달력 파싱에 필요 없는 이미지 로딩과 알림 권한 요청 차단
+        # (스타일시트는 숨김 요소가 클릭 대상이 될 수 있어 유지)
+        chrome_options.add_experimental_option('prefs', {
+            'profile.managed_default_content_settings.images': 2,
+            'profile.default_content_setting_values.notifications': 2,
+        })
         
         try:
+            # 암묵적 대기 없이 필요한 곳에서만 WebDriverWait 사용
             driver = webdriver.Chrome(options=chrome_options)
-            driver.implicitly_wait(15)
-            return driver
         except Exception as e:
             logging.error(f"드라이버 설정 실패: {e}")
             return None
+        
+        # 웹폰트·통계 스크립트 요청 차단
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logging.debug(f"리소스 차단 설정 실패: {e}")
+        
+        return driver
 
-    def send_telegram_message(self, message):
-        """텔레그램 메시지 발송"""
+    def acquire_driver(self):
+        """쉬고 있는 드라이버를 꺼내거나 새로 생성 ((슬롯 번호, 드라이버), 실패 시 (None, None))"""
+        with self._drivers_lock:
+            if self._idle_slots:
+                slot = self._idle_slots.pop()
+                self._driver_uses[slot] += 1
+                return slot, self._drivers[slot]
+            
+            # 동시에 뜬 Chrome끼리 프로필·캐시 디렉터리를 공유할 수 없어 빈 슬롯 번호를 배정
+            slot = next(i for i in itertools.count() if i not in self._drivers)
+            self._drivers[slot] = None
+        
+        driver = self.setup_driver(slot)
+        with self._drivers_lock:
+            if not driver:
+                del self._drivers[slot]
+                return None, None
+            self._drivers[slot] = driver
+            self._driver_uses[slot] = 1
+        return slot, driver
+
+    def release_driver(self, slot, discard=False):
+        """드라이버 반납 (오류가 났거나 오래 쓴 드라이버는 종료하고 다음엔 새로 생성)"""
+        with self._drivers_lock:
+            if not discard and self._driver_uses[slot] < self.DRIVER_MAX_USES:
+                self._idle_slots.append(slot)
+                return
+            driver = self._drivers.pop(slot)
+            del self._driver_uses[slot]
         try:
-            url = f"https://api.telegram.org/bot{self.telegram_config['bot_token']}/sendMessage"
-            data = {
-                'chat_id': self.telegram_config['chat_id'],
-                'text': message,
-                'parse_mode': 'HTML'
-            }
-            response = requests.post(url, data=data, timeout=30)
-            return response.status_code == 200
+            driver.quit()
         except Exception as e:
-            logging.error(f"텔레그램 오류: {e}")
-            return False
+            logging.debug(f"드라이버 종료 중 오류: {e}")
+
+    def quit_drivers(self):
+        """생성된 모든 드라이버 종료"""
+        with self._drivers_lock:
+            drivers, self._drivers = list(self._drivers.values()), {}
+            self._driver_uses.clear()
+            self._idle_slots.clear()
+        for driver in drivers:
+            if driver is None:
+                continue
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.debug(f"드라이버 종료 중 오류: {e}")
+
+    def split_message(self, message):
+        """텔레그램 길이 제한(UTF-16 기준)에 맞게 줄 단위로 메시지 분할"""
+        chunks = []
+        current = []
+        current_size = 0
+        for line in message.splitlines(keepends=True):
+            for piece, piece_size in self.split_long_line(line):
+                if current and current_size + piece_size > self.TELEGRAM_MAX_LENGTH:
+                    chunks.append("".join(current).rstrip('\n'))
+                    current = []
+                    current_size = 0
+                current.append(piece)
+                current_size += piece_size
+        if current:
+            chunks.append("".join(current).rstrip('\n'))
+        # 경계에서 줄바꿈만 남은 조각은 보내지 않음
+        return [chunk for chunk in chunks if chunk]
+
+    def split_long_line(self, line):
+        """한 줄을 길이 제한 이하 조각으로 나눔 → (조각, UTF-16 길이) (서로게이트 쌍은 나누지 않음)"""
+        line_size = len(line.encode('utf-16-le')) // 2
+        if line_size <= self.TELEGRAM_MAX_LENGTH:
+            return [(line, line_size)]
+        pieces = []
+        start = 0
+        piece_size = 0
+        for i, char in enumerate(line):
+            char_size = 2 if ord(char) > 0xFFFF else 1
+            if piece_size + char_size > self.TELEGRAM_MAX_LENGTH:
+                pieces.append((line[start:i], piece_size))
+                start = i
+                piece_size = 0
+            piece_size += char_size
+        pieces.append((line[start:], piece_size))
+        return pieces
+
+    def send_telegram_message(self, message):
+        """텔레그램 메시지 발송 (길면 나눠서 발송)"""
+        success = True
+        for chunk in self.split_message(message):
+            try:
+                data = {
+                    'chat_id': self.telegram_config['chat_id'],
+                    'text': chunk,
+                    'parse_mode': 'HTML',
+                    # 예약 사이트 링크 미리보기 생성 생략
+                    'disable_web_page_preview': True
+                }
+                response = self.session.post(self.telegram_url, json=data, timeout=(5, 30))
+                if response.status_code != 200:
+                    logging.error(f"텔레그램 발송 실패: {response.status_code} {response.text[:200]}")
+                    success = False
+            except Exception as e:
+                # 재시도 초과·연결 오류 등 모두 실패로만 기록 (오류 알림 경로에서도 호출되므로 예외를 내보내지 않음)
+                logging.error(f"텔레그램 발송 오류: {type(e).__name__}: {e}")
+                success = False
+        return success
+
+    def first_calendar_cell(self, driver):
+        """현재 표시된 달력의 첫 셀 (없으면 None)"""
+        from selenium.webdriver.common.by import By
+        
+        cells = driver.find_elements(By.CSS_SELECTOR, self.CALENDAR_CELL_CSS)
+        return cells[0] if cells else None
+
+    def wait_for_calendar(self, driver, old_cell, timeout=15):
+        """클릭 후 달력이 다시 그려질 때까지 대기"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        if old_cell is not None:
+            try:
+                WebDriverWait(driver, timeout).until(EC.staleness_of(old_cell))
+            except TimeoutException:
+                logging.debug("달력 갱신 감지 실패 - 현재 달력으로 진행")
+        WebDriverWait(driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, self.CALENDAR_CELL_CSS))
+        )
+
+    def displayed_month(self, driver):
+        """현재 표시된 월 (못 찾으면 None)"""
+        from selenium.webdriver.common.by import By
+        
+        # 달력 셀의 data-usedt에서 읽기 - 앞뒤 달 날짜가 섞여 있어도 가운데 셀은 표시 중인 달
+        cells = driver.find_elements(By.CSS_SELECTOR, self.CALENDAR_CELL_CSS)
+        if not cells:
+            return None
+        use_dt = _NON_DIGIT_RE.sub('', cells[len(cells) // 2].get_attribute("data-usedt") or '')
+        return int(use_dt[4:6]) if len(use_dt) >= 6 else None
 
     def navigate_to_month(self, driver, target_month):
         """월 이동"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            month_elements = driver.find_elements(By.XPATH, "//*[contains(text(), '월')]")
-            current_month = None
-            
-            # 현재 표시된 월 찾기
-            for elem in month_elements:
-                text = elem.text
-                match = re.search(r'(\d+)월', text)
-                if match:
-                    current_month = int(match.group(1))
-                    break
+            current_month = self.displayed_month(driver)
             
             if current_month is None:
                 logging.error("현재 월을 찾을 수 없습니다")
                 return False
             
-            clicks_needed = target_month - current_month
+            # 가장 가까운 방향으로 이동 (12월 → 1월은 이전 11번이 아니라 다음 1번)
+            clicks_needed = (target_month - current_month + 6) % 12 - 6
             
             if clicks_needed > 0:
                 for i in range(clicks_needed):
                     next_btn = WebDriverWait(driver, 15).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn-next"))
                     )
+                    old_cell = self.first_calendar_cell(driver)
                     next_btn.click()
-                    time.sleep(3)
+                    self.wait_for_calendar(driver, old_cell)
             elif clicks_needed < 0:
                 for i in range(-clicks_needed):
                     prev_btn = WebDriverWait(driver, 15).until(
                         EC.element_to_be_clickable((By.CSS_SELECTOR, ".btn-prev"))
                     )
+                    old_cell = self.first_calendar_cell(driver)
                     prev_btn.click()
-                    time.sleep(3)
+                    self.wait_for_calendar(driver, old_cell)
             
             return True
         except Exception as e:
             logging.error(f"월 이동 실패: {e}")
             return False
 
-    def parse_weekend_availability(self, driver, month, year):
-        """주말 예약 파싱"""
+    def extract_weekend_dates(self, cells, month):
+        """주말 셀 정보에서 잔여가 있는 예약 추출"""
         available_dates = []
         
-        try:
-            # 페이지 로딩 완료 대기
-            time.sleep(3)
-            
-            # 달력 셀들 찾기 - data 속성을 가진 요소들만
-            calendar_cells = driver.find_elements(By.CSS_SELECTOR, ".calendar-cell[data-deptid][data-usedt]")
-            
-            for cell in calendar_cells:
-                try:
-                    # 예약 가능 조건 확인 (웹페이지와 동일한 로직)
-                    prd_sal_stcd = cell.get_attribute("data-prdsalstcd")  # 판매 상태
-                    cal_yn = cell.get_attribute("data-calyn")  # 달력 활성화 여부
-                    
-                    # 예약 불가능한 경우 스킵 (JavaScript 조건과 동일)
-                    if (prd_sal_stcd != 'N' and prd_sal_stcd != 'R') or cal_yn != 'Y':
-                        continue
-                    
-                    # 날짜 추출
-                    day_element = cell.find_element(By.CSS_SELECTOR, ".day")
-                    day = int(day_element.text.strip())
-                    
-                    # 잔여 개수 추출
-                    try:
-                        contents_ul = cell.find_element(By.CSS_SELECTOR, "ul.contents")
-                        remaining_text = contents_ul.text
-                        remaining_match = re.search(r'생활관\s*:\s*잔여\s*(\d+)\s*개', remaining_text)
-                        
-                        if remaining_match:
-                            remaining = int(remaining_match.group(1))
-                            
-                            # 잔여가 0개면 스킵
-                            if remaining <= 0:
-                                continue
-                            
-                            # 주말 확인
-                            try:
-                                date_obj = datetime(year, month, day)
-                                weekday_num = date_obj.weekday()
-                                
-                                if weekday_num in self.weekend_days:
-                                    weekday_name = "금요일" if weekday_num == 4 else "토요일"
-                                    available_dates.append({
-                                        'date': f"{year}-{month:02d}-{day:02d}",
-                                        'weekday': weekday_name,
-                                        'remaining': remaining
-                                    })
-                                    
-                                    logging.info(f"유효한 예약 발견: {month}월 {day}일 ({weekday_name}) - 잔여 {remaining}개")
-                                    
-                            except ValueError:
-                                continue
-                                
-                    except:
-                        # contents가 없는 경우 (잔여 정보 없음)
-                        continue
-                        
-                except Exception as e:
-                    logging.debug(f"셀 파싱 중 오류: {e}")
-                    continue
+        for day, date_str, weekday_name, contents in cells:
+            remaining_match = _REMAIN_RE.search(contents)
+            if not remaining_match:
+                continue
+            
+            remaining = int(remaining_match.group(1))
+            
+            # 잔여가 0개면 스킵
+            if remaining <= 0:
+                continue
             
-            logging.info(f"{month}월 파싱 완료: {len(available_dates)}개 예약 가능")
-            return available_dates
+            available_dates.append({
+                'date': date_str,
+                'weekday': weekday_name,
+                'remaining': remaining
+            })
+            
+            logging.info(f"유효한 예약 발견: {month}월 {day}일 ({weekday_name}) - 잔여 {remaining}개")
+        
+        logging.info(f"{month}월 파싱 완료: {len(available_dates)}개 예약 가능")
+        return available_dates
+
+    def parse_weekend_availability(self, driver, month, year):
+        """주말 예약 파싱 (달력을 읽지 못하면 None)"""
+        try:
+            # 페이지 소스를 한 번만 받아 lxml로 파싱 (셀마다 드라이버 왕복하지 않도록)
+            # 로딩 대기는 호출 측(wait_for_calendar)에서 완료
+            # 화면에는 클릭한 공원의 달력만 있으므로 data-deptid 값은 비교하지 않음
+            return self.parse_calendar_html(driver.page_source, None, month, year)
             
         except Exception as e:
             logging.error(f"파싱 실패: {e}")
-            return []
+            return None
+
+    def fetch_month_html(self, park_code, year, month):
+        """월별 달력 HTML 직접 요청"""
+        # 필드명은 달력 셀의 data-deptid / data-usedt 속성 기준
+        # (응답에 해당 공원·월 셀이 없으면 parse_calendar_html이 None을 반환해 브라우저로 폴백)
+        data = {'deptId': park_code, 'useDt': f"{year}{month:02d}"}
+        response = self.session.post(self.url, data=data, timeout=30)
+        response.raise_for_status()
+        # 헤더에 charset이 없으면 requests가 ISO-8859-1로 가정하므로 본문으로 판별
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = response.apparent_encoding
+        return response.text
 
-    def check_park_availability(self, park_name):
-        """공원 체크"""
-        driver = self.setup_driver()
+    def parse_calendar_html(self, page_html, park_code, month, year):
+        """달력 HTML 파싱 (요청한 공원·월의 셀이 없으면 None, park_code가 None이면 공원은 확인하지 않음)"""
+        root = lxml_html.fromstring(page_html)
+        month_prefix = f"{year}{month:02d}"
+        weekend = weekend_days_in_month(year, month, self.weekend_days)
+        
+        cells = []
+        matched = 0
+        for elem in root.xpath(self.CALENDAR_CELL_XPATH):
+            use_dt = _NON_DIGIT_RE.sub('', elem.get('data-usedt', ''))
+            if not use_dt.startswith(month_prefix):
+                continue
+            if park_code is not None and elem.get('data-deptid') != park_code:
+                continue
+            matched += 1
+            
+            # 평일·예약 불가 셀은 속성만 보고 바로 스킵 (JavaScript 조건과 동일)
+            # 날짜는 data-usedt(YYYYMMDD)의 일자 부분
+            if len(use_dt) != 8:
+                continue
+            day = int(use_dt[6:])
+            weekend_entry = weekend.get(day)
+            if weekend_entry is None:
+                continue
+            if elem.get('data-prdsalstcd') not in ('N', 'R') or elem.get('data-calyn') != 'Y':
+                continue
+            
+            # 잔여 정보(ul.contents)가 없는 셀은 예약 불가로 보고 스킵
+            contents = self.find_contents(elem)
+            if contents is None:
+                continue
+            # 잔여 표시가 없는 셀은 정규식 없이 스킵
+            contents_text = contents.text_content()
+            if '생활관' in contents_text:
+                cells.append((day, *weekend_entry, contents_text))
+        
+        if not matched:
+            return None
+        
+        return self.extract_weekend_dates(cells, month)
+
+    def find_contents(self, elem):
+        """달력 셀의 잔여 정보 요소 (ul.contents, 없으면 None)"""
+        for child in elem.iterdescendants('ul'):
+            if 'contents' in (child.get('class') or '').split():
+                return child
+        return None
+
+    def check_month_http(self, park_name, month, year):
+        """HTTP 요청만으로 공원의 한 달 체크 (실패 시 None)"""
+        park_code = self.parks[park_name]
+        cache_key = f"v{self.PARSER_VERSION}-{park_code}-{year}{month:02d}"
+        try:
+            page_html = self.fetch_month_html(park_code, year, month)
+            page_hash = hashlib.blake2b(page_html.encode('utf-8'), digest_size=8).hexdigest()
+            
+            # 지난 실행과 응답이 같으면 파싱 생략
+            cached = self.response_cache.get(cache_key)
+            if cached and cached.get('hash') == page_hash:
+                logging.info(f"{park_name} {month}월 응답 변화 없음 - 이전 결과 사용")
+                available_dates = cached['dates']
+            else:
+                available_dates = self.parse_calendar_html(page_html, park_code, month, year)
+        except Exception as e:
+            logging.warning(f"{park_name} {month}월 HTTP 조회 실패: {e}")
+            return None
+        
+        if available_dates is None:
+            logging.warning(f"{park_name} {month}월 응답에 달력 정보 없음")
+        else:
+            self.next_response_cache[cache_key] = {'hash': page_hash, 'dates': available_dates}
+        return available_dates
+
+    def check_park_availability(self, park_name, months=None):
+        """공원 체크 (브라우저, months를 주면 해당 (월, 연도)만)"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        
+        if months is None:
+            months = self.month_targets
+        logging.info(f"{park_name} 브라우저로 체크 중...")
+        slot, driver = self.acquire_driver()
         if not driver:
             return {}
-            
+        
+        failed = False
         try:
-            driver.get(self.url)
-            time.sleep(10)
+            # 이미 예약 페이지에 있으면 다시 로드하지 않고 공원만 바꿔 선택
+            if driver.current_url != self.url:
+                driver.get(self.url)
+                link_timeout = 20
+            else:
+                # 이미 떠 있는 페이지면 공원 링크가 바로 있어야 하므로 짧게 대기
+                link_timeout = 5
             
-            park_link = WebDriverWait(driver, 20).until(
+            park_link = WebDriverWait(driver, link_timeout).until(
                 EC.element_to_be_clickable((By.XPATH, f"//*[contains(text(), '{park_name}')]"))
             )
+            old_cell = self.first_calendar_cell(driver)
             park_link.click()
-            time.sleep(5)
+            self.wait_for_calendar(driver, old_cell)
             
             result = {}
             
-            # 당월 체크
-            if not self.navigate_to_month(driver, self.target_months[0]):
-                logging.warning(f"{self.target_months[0]}월로 이동 실패")
-            else:
-                available_dates = self.parse_weekend_availability(driver, self.target_months[0], self.target_year)
-                month_name = f"{self.target_months[0]}월"
-                result[month_name] = available_dates
-            
-            # 익월 체크
-            if not self.navigate_to_month(driver, self.target_months[1]):
-                logging.warning(f"{self.target_months[1]}월로 이동 실패")
-            else:
-                available_dates = self.parse_weekend_availability(driver, self.target_months[1], self.next_year)
-                month_name = f"{self.target_months[1]}월"
-                result[month_name] = available_dates
+            for month, year in months:
+                if not self.navigate_to_month(driver, month):
+                    logging.warning(f"{month}월로 이동 실패")
+                    continue
+                available_dates = self.parse_weekend_availability(driver, month, year)
+                if available_dates is None:
+                    # 읽지 못한 달은 결과에서 뺌 (check_once에서 이전 상태를 유지)
+                    logging.warning(f"{park_name} {month}월 달력을 읽지 못함")
+                    continue
+                result[f"{month}월"] = available_dates
             
             return result
         except Exception as e:
             logging.error(f"{park_name} 체크 실패: {e}")
+            failed = True
             return {}
         finally:
-            if driver:
-                driver.quit()
+            # 오류 후에는 페이지 상태를 믿을 수 없어 드라이버를 버림
+            self.release_driver(slot, discard=failed)
 
-    def check_all_parks(self):
-        """모든 공원 체크"""
-        all_results = {}
+    async def check_month_http_async(self, pool, park_name, month, year):
+        """HTTP 월 체크를 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        available_dates = await loop.run_in_executor(pool, self.check_month_http, park_name, month, year)
+        return park_name, month, available_dates
+
+    async def check_all_parks_async(self):
+        """모든 공원 동시 체크"""
+        loop = asyncio.get_running_loop()
+        park_names = list(self.parks)
+        # 완료 순서와 상관없이 공원·월 순서를 유지하도록 미리 채워둠
+        http_results = {
+            park_name: {f"{month}월": None for month, _ in self.month_targets}
+            for park_name in park_names
+        }
+        pending_months = {park_name: len(self.month_targets) for park_name in park_names}
+        browser_tasks = {}
+        
+        # 공원 × 월 HTTP 요청을 한꺼번에 보내고, 공원의 월 요청이 모두 끝나면
+        # 실패한 월만 바로 브라우저 체크 시작 (브라우저 풀 스레드는 실제 작업이 들어올 때만 생성됨)
+        with ThreadPoolExecutor(max_workers=self.http_workers) as http_pool, \
+                ThreadPoolExecutor(max_workers=self.max_workers) as browser_pool:
+            http_tasks = [
+                self.check_month_http_async(http_pool, park_name, month, year)
+                for park_name in park_names for month, year in self.month_targets
+            ]
+            for next_done in asyncio.as_completed(http_tasks):
+                park_name, month, available_dates = await next_done
+                http_results[park_name][f"{month}월"] = available_dates
+                pending_months[park_name] -= 1
+                if pending_months[park_name]:
+                    continue
+                
+                failed_months = [
+                    (month, year) for month, year in self.month_targets
+                    if http_results[park_name][f"{month}월"] is None
+                ]
+                if failed_months:
+                    logging.info(f"{park_name} 브라우저로 재시도: {', '.join(f'{month}월' for month, _ in failed_months)}")
+                    browser_tasks[park_name] = loop.run_in_executor(
+                        browser_pool, self.check_park_availability, park_name, failed_months
+                    )
+            
+            browser_results = await asyncio.gather(*browser_tasks.values(), return_exceptions=True)
+        
+        browser_results = dict(zip(browser_tasks, browser_results))
         
-        for park_name in self.parks.keys():
-            logging.info(f"{park_name} 체크 중...")
-            park_result = self.check_park_availability(park_name)
+        all_results = {}
+        for park_name in park_names:
+            park_result = browser_results.get(park_name, {})
+            if isinstance(park_result, Exception):
+                logging.error(f"{park_name} 체크 실패: {park_result}")
+                park_result = {}
             
-            if park_result:
-                all_results[park_name] = park_result
-            time.sleep(5)
+            # HTTP로 받은 월에 브라우저로 다시 확인한 월을 채워 넣음 (끝내 못 받은 월은 제외)
+            merged = {}
+            for month_name, dates in http_results[park_name].items():
+                dates = park_result.get(month_name, dates)
+                if dates is not None:
+                    merged[month_name] = dates
+            if merged:
+                all_results[park_name] = merged
         
         return all_results
 
+    def check_all_parks(self):
+        """모든 공원 체크"""
+        return asyncio.run(self.check_all_parks_async())
+
+    def carry_over_failed_months(self, previous_state, current_results):
+        """체크하지 못한 (공원, 월)은 이전 상태를 그대로 유지 (실패를 '예약 사라짐'으로 알리지 않도록)
+        
+        (병합 결과, 체크하지 못한 "공원 월" 목록)을 반환
+        """
+        merged = {}
+        failed = []
+        for park_name in self.parks:
+            current_months = current_results.get(park_name, {})
+            previous_months = previous_state.get(park_name, {})
+            months = {}
+            for month, _ in self.month_targets:
+                month_name = f"{month}월"
+                if month_name in current_months:
+                    months[month_name] = current_months[month_name]
+                    continue
+                failed.append(f"{park_name} {month_name}")
+                if month_name in previous_months:
+                    logging.warning(f"{park_name} {month_name} 체크 실패 - 이전 상태 유지")
+                    months[month_name] = previous_months[month_name]
+            if months:
+                merged[park_name] = months
+        return merged, failed
+
     def send_change_notification(self, changes, current_results):
         """간단한 현재 예약 현황 알림"""
         if not any(changes.values()):
             return False
             
-        message = f"""🏞️ 국립공원 예약 현황 업데이트
+        parts = [f"""🏞️ 국립공원 예약 현황 업데이트
 
-🕐 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} (UTC)
+🕐 {self.checked_at} (UTC)
 
 📋 현재 예약 가능:
 
-"""
+"""]
+        
+        format_date_line = "  • {date} ({weekday}) - 잔여 {remaining}개\n".format_map
         
         # 현재 전체 예약 가능 상황만 표시
         total_available = 0
         for park_name, months_data in current_results.items():
-            park_has_availability = False
-            park_dates = []
-            
-            for month_name, dates in months_data.items():
-                if dates:
-                    park_has_availability = True
-                    park_dates.extend(dates)
-                    total_available += len(dates)
+            park_dates = [date_info for dates in months_data.values() for date_info in dates]
+            if not park_dates:
+                continue
             
-            if park_has_availability:
-                message += f"🏔️ {park_name}\n"
-                for date_info in park_dates:
-                    message += f"  • {date_info['date']} ({date_info['weekday']}) - 잔여 {date_info['remaining']}개\n"
-                message += "\n"
+            total_available += len(park_dates)
+            parts.append(f"🏔️ {park_name}\n")
+            parts.extend(map(format_date_line, park_dates))
+            parts.append("\n")
         
         if total_available == 0:
-            message += "❌ 현재 예약 가능한 주말 없음\n\n"
+            parts.append("❌ 현재 예약 가능한 주말 없음\n\n")
         else:
-            message += f"📊 총 {total_available}개 주말 날짜 예약 가능\n\n"
+            parts.append(f"📊 총 {total_available}개 주말 날짜 예약 가능\n\n")
         
-        message += f"🔗 {self.url}\n\n🤖 GitHub Actions 자동 모니터링"
+        parts.append(f"🔗 {self.url}\n\n🤖 GitHub Actions 자동 모니터링")
         
+        message = "".join(parts)
         return self.send_telegram_message(message)
 
     def run_single_check(self):
         """한 번의 체크 실행"""
+        try:
+            return self.check_once()
+        finally:
+            self.quit_drivers()
+
+    def run_continuous(self, interval, duration):
+        """interval초 간격으로 duration초 동안 반복 체크 (세션·드라이버를 계속 재사용)"""
+        deadline = time.monotonic() + duration
+        # 체크 소요 시간과 상관없이 시작 시각이 interval 간격으로 맞춰지도록 다음 시작 시각 기준으로 대기
+        next_start = time.monotonic() + interval
+        success = True
+        try:
+            while True:
+                success = self.check_once() and success
+                # 체크가 interval보다 오래 걸렸으면 밀린 회차는 건너뛰고 다음 간격에 맞춤
+                now = time.monotonic()
+                if next_start < now:
+                    next_start += -(-(now - next_start) // interval) * interval
+                if next_start >= deadline:
+                    return success
+                time.sleep(next_start - now)
+                next_start += interval
+                self.set_check_time()
+        finally:
+            self.quit_drivers()
+
+    def check_once(self):
+        """상태 로드 → 체크 → 알림 → 저장"""
         logging.info("GitHub Actions 모니터링 시작")
         
         try:
             previous_state = self.load_previous_state()
-            current_results = self.check_all_parks()
+            self.response_cache = self.load_response_cache()
+            self.next_response_cache = {}
+            current_results, failed = self.carry_over_failed_months(previous_state, self.check_all_parks())
             changes = self.compare_states(previous_state, current_results)
             
             if any(changes.values()):
@@ -422,6 +881,16 @@ class GitHubActionsMonitor:
                 success = True
             
             self.save_current_state(current_results)
+            
+            # 이전 상태로 대신한 결과는 오래된 정보일 수 있으므로 알리고 실패로 처리 (작업이 실패로 표시되도록)
+            if failed:
+                logging.error(f"체크 실패: {', '.join(failed)}")
+                failed_lines = "\n".join(f"  • {target}" for target in failed)
+                self.send_telegram_message(
+                    f"⚠️ 예약 현황 체크 실패 (이전 상태 유지)\n\n{failed_lines}\n\n{self.checked_at} (UTC)"
+                )
+                success = False
+            
             return success
             
         except Exception as e:
@@ -430,9 +899,35 @@ class GitHubActionsMonitor:
             self.send_telegram_message(error_message)
             return False
 
+def read_seconds_env(name):
+    """환경 변수의 초 단위 양의 정수 (없으면 0, 잘못된 값이면 None)"""
+    value = os.environ.get(name, '').strip()
+    if not value:
+        return 0
+    try:
+        seconds = int(value)
+    except ValueError:
+        seconds = 0
+    if seconds <= 0:
+        logging.error(f"{name} 값이 올바르지 않음: {value!r} (초 단위 양의 정수)")
+        return None
+    return seconds
+
 def main():
     monitor = GitHubActionsMonitor()
-    success = monitor.run_single_check()
+    
+    # KNPS_LOOP_INTERVAL을 주면 한 작업 안에서 KNPS_LOOP_DURATION초(기본 3000) 동안 반복 체크
+    # 값이 잘못되면 한 번만 체크
+    interval = read_seconds_env('KNPS_LOOP_INTERVAL')
+    duration = read_seconds_env('KNPS_LOOP_DURATION')
+    if interval and duration is not None:
+        duration = duration or 3000
+        logging.info(f"반복 모드: {interval}초 간격, {duration}초 동안")
+        success = monitor.run_continuous(interval, duration)
+    else:
+        if interval is None or duration is None:
+            logging.warning("반복 설정이 올바르지 않아 한 번만 체크")
+        success = monitor.run_single_check()
     
     if success:
         logging.info("모니터링 완료")